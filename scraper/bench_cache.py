@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Mide la reducción del tiempo hasta el formulario listo con caché persistente
+
+Compara cargas de https://recompensas.pe/requisitoriados con un perfil de
+Chromium vacío (comportamiento por defecto) frente a un perfil persistente
+con la caché HTTP ya poblada.
+
+Uso:
+    python bench_cache.py [repeticiones]
+"""
+
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from scraper import RequisitoriadosScraper
+
+
+def resumir(etiqueta, tiempos):
+    """Imprime media y mediana de una serie de tiempos"""
+    if not tiempos:
+        print(f"{etiqueta:<22} sin mediciones")
+        return
+    print(
+        f"{etiqueta:<22} media {statistics.mean(tiempos):6.2f} s   "
+        f"mediana {statistics.median(tiempos):6.2f} s   (n={len(tiempos)})"
+    )
+
+
+def main():
+    """Ejecuta el benchmark en frío y en caliente"""
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print("=" * 60)
+    print("Tiempo hasta formulario listo: perfil vacío vs caché persistente")
+    print("=" * 60)
+
+    frio = RequisitoriadosScraper(cache_persistente=False)
+    tiempos_frio = frio.medir_tiempo_formulario(repeticiones)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        caliente = RequisitoriadosScraper(cache_persistente=True)
+        caliente.perfil_dir = Path(tmp) / "perfil"
+        # Primera carga para poblar la caché, no se cuenta
+        caliente.medir_tiempo_formulario(1)
+        tiempos_caliente = caliente.medir_tiempo_formulario(repeticiones)
+
+    print()
+    resumir("Perfil vacío:", tiempos_frio)
+    resumir("Caché persistente:", tiempos_caliente)
+
+    if tiempos_frio and tiempos_caliente:
+        reduccion = 1 - statistics.median(tiempos_caliente) / statistics.median(tiempos_frio)
+        print(f"\nReducción (mediana): {reduccion:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,16 @@ Web Scraper para https://recompensas.pe/requisitoriados
 Extrae información de personas requisitoriadas
 """
 
+import gc
+import gzip
+import hashlib
 import json
 import logging
 import os
+import queue
+import re
+import shutil
+import threading
 import time
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -14,6 +21,25 @@ import requests
 import pandas as pd
 from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeoutError
 
+try:
+    import psutil
+except ImportError:  # Opcional: sin psutil solo se mide el proceso de Python
+    psutil = None
+
+import static_parser
+from static_parser import (
+    clave_registro,
+    deduplicar_registros,
+    extraer_campos,
+    SELECTOR_TARJETAS,
+    SELECTOR_TARJETAS_ALT,
+    SELECTOR_NOMBRE,
+    SELECTOR_FOTO,
+    SELECTOR_RECOMPENSA,
+    SELECTOR_CUERPO,
+    SELECTOR_PAGINACION,
+)
+
 
 # Configuración de logging
 logging.basicConfig(
@@ -29,16 +55,75 @@ class RequisitoriadosScraper:
     BASE_URL = "https://recompensas.pe/requisitoriados"
     OUTPUT_DIR = Path(__file__).parent / "output"
     FOTOS_DIR = OUTPUT_DIR / "fotos"
+    SNAPSHOTS_DIR = OUTPUT_DIR / "snapshots"
+    PERFIL_DIR = OUTPUT_DIR / "perfil_navegador"
+    # Subdirectorios del perfil de Chromium que contienen caché HTTP/JS
+    CACHE_SUBDIRS = ("Default/Cache", "Default/Code Cache", "Default/Service Worker")
+    VERSION_FILE = "version_sitio.txt"
+    UMBRAL_RECICLAJE = 0.8  # Fracción de memoria_maxima_mb que fuerza un reciclaje
+    MARGEN_RECICLAJE = 0.05  # Crecimiento mínimo (fracción del límite) para volver a reciclar
+    ALFABETO_ENUMERACION = "ABCDEFGHIJKLMNOPQRSTUVWXYZÑÁÉÍÓÚÜ"
+    SEPARADORES_ENUMERACION = " -'"  # Solo para extender prefijos, nunca al inicio
     
-    def __init__(self):
-        """Inicializa el scraper"""
+    def __init__(self, guardar_snapshots: bool = False, comprimir_snapshots: bool = True,
+                 reciclar_cada: int = 25, memoria_maxima_mb: Optional[float] = None,
+                 pausa_memoria: int = 30, descargar_fotos: bool = True,
+                 cache_persistente: bool = False, tamano_cache_mb: int = 200,
+                 headless: bool = True):
+        """
+        Inicializa el scraper
+        
+        Args:
+            guardar_snapshots: Guardar el HTML renderizado de cada búsqueda
+            comprimir_snapshots: Comprimir los snapshots con gzip (.html.gz)
+            reciclar_cada: Búsquedas por contexto antes de reciclarlo (0 para desactivar)
+            memoria_maxima_mb: Límite de RSS en MB para el watchdog (None para desactivar)
+            pausa_memoria: Segundos de pausa cuando se supera el límite de memoria
+            descargar_fotos: Descargar la foto de cada resultado
+            cache_persistente: Usar un perfil de Chromium persistente (PERFIL_DIR)
+                para reutilizar la caché HTTP del bundle de Angular entre búsquedas
+            tamano_cache_mb: Tamaño máximo de la caché de disco en MB
+            headless: Ejecutar el navegador sin ventana visible
+        """
+        self.guardar_snapshots = guardar_snapshots
+        self.comprimir_snapshots = comprimir_snapshots
+        self.reciclar_cada = reciclar_cada
+        self.memoria_maxima_mb = memoria_maxima_mb
+        self.pausa_memoria = pausa_memoria
+        self.descargar_fotos = descargar_fotos
+        self.cache_persistente = cache_persistente
+        self.tamano_cache_mb = tamano_cache_mb
+        self.headless = headless
+        self.perfil_dir = self.PERFIL_DIR
         self._setup_directories()
         self.resultados = []
+        self.pendientes = []
+        self.estadisticas_memoria = {'pico_rss_mb': 0.0, 'reciclajes': 0, 'pausas': 0}
+        self.no_cubiertos = {}  # Clases de registros no alcanzables (ver enumerar_registro)
+        
+        # Navegador compartido entre búsquedas (ver buscar_multiples)
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._busquedas_en_contexto = 0
+        self._rss_tras_reciclaje = 0.0
+        self._aviso_sin_medicion = False
+        self._version_verificada = False
+        self.tiempos_formulario = []  # Segundos hasta que el formulario está listo
+        
+        # Estado de la última búsqueda (usado por enumerar_registro)
+        self.limite_resultados = None
+        self._ultima_saturada = False
+        self._ultima_paginada = False
+        self._ultima_tarjetas = 0
+        self._ultima_fallida = False
         
     def _setup_directories(self):
         """Crea los directorios necesarios"""
         self.OUTPUT_DIR.mkdir(exist_ok=True)
         self.FOTOS_DIR.mkdir(exist_ok=True)
+        if self.guardar_snapshots:
+            self.SNAPSHOTS_DIR.mkdir(exist_ok=True)
         logger.info(f"Directorios creados: {self.OUTPUT_DIR}, {self.FOTOS_DIR}")
     
     def _wait_for_results(self, page: Page, timeout: int = 10000) -> bool:
@@ -75,84 +160,18 @@ class RequisitoriadosScraper:
             Diccionario con los datos extraídos o None si hay error
         """
         try:
-            data = {}
-            
-            # Extraer nombre completo
-            nombre_elem = card.query_selector('h5.card-title, h4.card-title, div.card-title, p.fw-bold')
-            data['nombre_completo'] = nombre_elem.inner_text().strip() if nombre_elem else "N/A"
-            
-            # Extraer foto URL
-            img_elem = card.query_selector('img')
-            data['foto_url'] = img_elem.get_attribute('src') if img_elem else "N/A"
-            
-            # Extraer recompensa
-            recompensa_elem = card.query_selector('p.text-danger, span.text-danger, div.text-danger, h3.text-danger, h4.text-danger')
-            if not recompensa_elem:
-                # Buscar en todo el texto que contenga "S/"
-                all_text = card.inner_text()
-                for line in all_text.split('\n'):
-                    if 'S/' in line or 's/' in line.lower():
-                        data['recompensa'] = line.strip()
-                        break
-                else:
-                    data['recompensa'] = "N/A"
-            else:
-                data['recompensa'] = recompensa_elem.inner_text().strip()
-            
-            # Extraer estado, sexo, lugar de RO y delitos
-            # Estos datos suelen estar en el cuerpo de la tarjeta
-            card_body = card.query_selector('div.card-body')
-            if card_body:
-                body_text = card_body.inner_text()
-                lines = body_text.split('\n')
-                
-                data['estado'] = "N/A"
-                data['sexo'] = "N/A"
-                data['lugar_ro'] = "N/A"
-                data['delitos'] = "N/A"
-                
-                for i, line in enumerate(lines):
-                    line_lower = line.lower().strip()
-                    
-                    if 'estado' in line_lower and i + 1 < len(lines):
-                        # El valor puede estar en la misma línea o en la siguiente
-                        if ':' in line:
-                            data['estado'] = line.split(':', 1)[1].strip()
-                        elif i + 1 < len(lines):
-                            data['estado'] = lines[i + 1].strip()
-                    
-                    elif 'sexo' in line_lower:
-                        if ':' in line:
-                            data['sexo'] = line.split(':', 1)[1].strip()
-                        elif i + 1 < len(lines):
-                            data['sexo'] = lines[i + 1].strip()
-                    
-                    elif 'lugar' in line_lower and 'ro' in line_lower:
-                        if ':' in line:
-                            data['lugar_ro'] = line.split(':', 1)[1].strip()
-                        elif i + 1 < len(lines):
-                            data['lugar_ro'] = lines[i + 1].strip()
-                    
-                    elif 'delito' in line_lower:
-                        if ':' in line:
-                            data['delitos'] = line.split(':', 1)[1].strip()
-                        elif i + 1 < len(lines):
-                            # El delito puede ocupar múltiples líneas
-                            delito_lines = []
-                            for j in range(i + 1, len(lines)):
-                                next_line = lines[j].strip()
-                                if next_line and not any(k in next_line.lower() for k in ['estado', 'sexo', 'lugar', 'recompensa']):
-                                    delito_lines.append(next_line)
-                                else:
-                                    break
-                            if delito_lines:
-                                data['delitos'] = ' '.join(delito_lines)
-            else:
-                # Si no hay card-body, buscar en toda la tarjeta
-                data['estado'] = "N/A"
-                data['sexo'] = "N/A"
-                data['lugar_ro'] = "N/A"
-                data['delitos'] = "N/A"
+            nombre_elem = card.query_selector(SELECTOR_NOMBRE)
+            img_elem = card.query_selector(SELECTOR_FOTO)
+            recompensa_elem = card.query_selector(SELECTOR_RECOMPENSA)
+            card_body = card.query_selector(SELECTOR_CUERPO)
+            
+            data = extraer_campos(
+                nombre=nombre_elem.inner_text() if nombre_elem else None,
+                foto_url=img_elem.get_attribute('src') if img_elem else None,
+                recompensa=recompensa_elem.inner_text() if recompensa_elem else None,
+                texto_tarjeta=card.inner_text() if not recompensa_elem else "",
+                texto_cuerpo=card_body.inner_text() if card_body else None,
+            )
             
             logger.info(f"Datos extraídos para: {data['nombre_completo']}")
             return data
@@ -161,6 +180,69 @@ class RequisitoriadosScraper:
             logger.error(f"Error extrayendo datos de tarjeta: {e}")
             return None
     
+    def _guardar_snapshot(self, page: Page, nombre_busqueda: str) -> str:
+        """
+        Guarda el HTML renderizado de la página de resultados
+        
+        Args:
+            page: Página de Playwright con los resultados cargados
+            nombre_busqueda: Nombre buscado (para el nombre del archivo)
+            
+        Returns:
+            Ruta donde se guardó el snapshot o "N/A" si falla
+        """
+        try:
+            safe_name = "".join(c for c in nombre_busqueda if c.isalnum() or c in (' ', '_')).strip()
+            safe_name = safe_name.replace(' ', '_')[:80] or "busqueda"
+            # El hash de la consulta original evita colisiones entre consultas
+            # que se sanean igual (O'BRIEN / OBRIEN, garcia / GARCIA)
+            huella = hashlib.sha256(nombre_busqueda.encode('utf-8')).hexdigest()[:8]
+            safe_name = f"{safe_name}_{huella}"
+            
+            html = page.content()
+            
+            if self.comprimir_snapshots:
+                filepath = self.SNAPSHOTS_DIR / f"{safe_name}.html.gz"
+                with gzip.open(filepath, 'wt', encoding='utf-8') as f:
+                    f.write(html)
+            else:
+                filepath = self.SNAPSHOTS_DIR / f"{safe_name}.html"
+                filepath.write_text(html, encoding='utf-8')
+            
+            logger.info(f"Snapshot guardado: {filepath.name}")
+            return str(filepath)
+            
+        except Exception as e:
+            logger.error(f"Error guardando snapshot de '{nombre_busqueda}': {e}")
+            return "N/A"
+    
+    def _nombre_archivo_foto(self, foto_url: str, nombre: str) -> str:
+        """
+        Construye el nombre de archivo local de la foto de un requisitoriado
+        
+        Args:
+            foto_url: URL de la foto
+            nombre: Nombre del requisitoriado
+            
+        Returns:
+            Nombre de archivo seguro con un hash de la URL y su extensión
+        """
+        # Crear nombre de archivo seguro
+        safe_name = "".join(c for c in nombre if c.isalnum() or c in (' ', '_')).rstrip()
+        safe_name = safe_name.replace(' ', '_')[:50]  # Limitar longitud
+        # El hash de la URL separa las fotos de personas distintas con el mismo
+        # nombre (clave_registro las conserva como registros distintos)
+        huella = hashlib.sha256(foto_url.encode('utf-8')).hexdigest()[:8]
+        
+        # Determinar extensión
+        ext = '.jpg'
+        if foto_url.lower().endswith('.png'):
+            ext = '.png'
+        elif foto_url.lower().endswith('.jpeg'):
+            ext = '.jpeg'
+        
+        return f"{safe_name}_{huella}{ext}"
+    
     def _download_photo(self, foto_url: str, nombre: str) -> str:
         """
         Descarga la foto de un requisitoriado
@@ -176,18 +258,7 @@ class RequisitoriadosScraper:
             return "N/A"
         
         try:
-            # Crear nombre de archivo seguro
-            safe_name = "".join(c for c in nombre if c.isalnum() or c in (' ', '_')).rstrip()
-            safe_name = safe_name.replace(' ', '_')[:50]  # Limitar longitud
-            
-            # Determinar extensión
-            ext = '.jpg'
-            if foto_url.lower().endswith('.png'):
-                ext = '.png'
-            elif foto_url.lower().endswith('.jpeg'):
-                ext = '.jpeg'
-            
-            filename = f"{safe_name}{ext}"
+            filename = self._nombre_archivo_foto(foto_url, nombre)
             filepath = self.FOTOS_DIR / filename
             
             # Descargar imagen
@@ -210,10 +281,373 @@ class RequisitoriadosScraper:
             logger.error(f"Error descargando foto {foto_url}: {e}")
             return "N/A"
     
+    def _version_sitio(self) -> Optional[str]:
+        """
+        Obtiene una huella de la versión desplegada del sitio
+        
+        Returns:
+            Hash de los bundles JS/CSS referenciados por la página o None si falla
+        """
+        try:
+            response = requests.get(self.BASE_URL, timeout=30)
+            response.raise_for_status()
+            bundles = sorted(set(re.findall(r'(?:src|href)="([^"]+\.(?:js|css))"', response.text)))
+            if not bundles:
+                return None
+            return hashlib.sha256('\n'.join(bundles).encode('utf-8')).hexdigest()[:16]
+        except Exception as e:
+            logger.warning(f"No se pudo obtener la versión del sitio: {e}")
+            return None
+    
+    def _perfiles_cache(self) -> List[Path]:
+        """Devuelve perfil_dir y los perfiles hermanos de los trabajadores de enumeración"""
+        perfiles = [self.perfil_dir]
+        if self.perfil_dir.parent.is_dir():
+            perfiles.extend(sorted(
+                p for p in self.perfil_dir.parent.glob(f"{self.perfil_dir.name}_*") if p.is_dir()
+            ))
+        return perfiles
+    
+    def invalidar_cache(self):
+        """
+        Borra la caché HTTP de los perfiles persistentes (cookies y demás datos se conservan)
+        
+        Incluye los perfiles de los trabajadores de enumerar_registro.
+        """
+        for perfil in self._perfiles_cache():
+            for subdir in self.CACHE_SUBDIRS:
+                shutil.rmtree(perfil / subdir, ignore_errors=True)
+            (perfil / self.VERSION_FILE).unlink(missing_ok=True)
+            logger.info(f"Caché del navegador invalidada: {perfil}")
+    
+    def _verificar_version_cache(self):
+        """Invalida la caché del perfil si el sitio desplegó una versión nueva"""
+        self._version_verificada = True
+        version = self._version_sitio()
+        if version is None:
+            return
+        
+        version_file = self.perfil_dir / self.VERSION_FILE
+        anterior = version_file.read_text().strip() if version_file.exists() else None
+        if anterior is not None and anterior != version:
+            logger.info(f"Nueva versión del sitio ({anterior} -> {version})")
+            self.invalidar_cache()
+        
+        self.perfil_dir.mkdir(parents=True, exist_ok=True)
+        version_file.write_text(version)
+    
+    def _nuevo_contexto(self):
+        """
+        Crea el contexto de navegación
+        
+        Con cache_persistente se lanza un contexto persistente sobre perfil_dir,
+        de modo que la caché HTTP sobrevive a reciclajes, reintentos y ejecuciones.
+        """
+        if not self.cache_persistente:
+            return self._browser.new_context(
+                viewport={'width': 1920, 'height': 1080}
+            )
+        
+        self.perfil_dir.mkdir(parents=True, exist_ok=True)
+        return self._playwright.chromium.launch_persistent_context(
+            str(self.perfil_dir),
+            headless=self.headless,
+            viewport={'width': 1920, 'height': 1080},
+            args=[f"--disk-cache-size={self.tamano_cache_mb * 1024 * 1024}"],
+        )
+    
+    def _iniciar_navegador(self):
+        """Lanza Playwright, el navegador y un contexto reutilizable"""
+        if self.cache_persistente and not self._version_verificada:
+            self._verificar_version_cache()
+        
+        self._playwright = sync_playwright().start()
+        if not self.cache_persistente:
+            self._browser = self._playwright.chromium.launch(headless=self.headless)
+        self._context = self._nuevo_contexto()
+        self._busquedas_en_contexto = 0
+    
+    def _cerrar_navegador(self):
+        """Cierra el contexto, el navegador y Playwright ignorando errores"""
+        for recurso in (self._context, self._browser):
+            if recurso is not None:
+                try:
+                    recurso.close()
+                except Exception as e:
+                    logger.debug(f"Error cerrando recurso del navegador: {e}")
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error deteniendo Playwright: {e}")
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._busquedas_en_contexto = 0
+        self._rss_tras_reciclaje = 0.0
+    
+    def _reiniciar_navegador(self):
+        """
+        Cierra y vuelve a lanzar el navegador completo
+        
+        Si el relanzamiento falla el navegador queda cerrado y la siguiente
+        búsqueda abrirá uno propio.
+        """
+        logger.info("Reiniciando navegador")
+        self._cerrar_navegador()
+        try:
+            self._iniciar_navegador()
+        except Exception as e:
+            logger.error(f"Error relanzando navegador: {e}")
+            self._cerrar_navegador()
+    
+    def _reciclar_contexto(self):
+        """Descarta el contexto actual (y sus páginas) y crea uno nuevo"""
+        logger.info(f"Reciclando contexto tras {self._busquedas_en_contexto} búsquedas")
+        self.estadisticas_memoria['reciclajes'] += 1
+        try:
+            self._context.close()
+            self._context = self._nuevo_contexto()
+            self._busquedas_en_contexto = 0
+            self._rss_tras_reciclaje = self._registrar_memoria()
+        except Exception as e:
+            logger.error(f"Error reciclando contexto: {e}")
+            self._reiniciar_navegador()
+    
+    @staticmethod
+    def _memoria_proceso(proceso) -> int:
+        """
+        Memoria de un proceso en bytes sin contar dos veces las páginas compartidas
+        
+        Usa PSS (Linux) o USS si están disponibles; si no, RSS.
+        """
+        try:
+            info = proceso.memory_full_info()
+            pss = getattr(info, 'pss', None)
+            return pss if pss is not None else info.uss
+        except (psutil.AccessDenied, AttributeError):
+            return proceso.memory_info().rss
+    
+    def _memoria_rss_mb(self) -> float:
+        """
+        Mide la memoria del scraper
+        
+        Returns:
+            Memoria en MB del proceso de Python más sus procesos hijos
+            (driver de Playwright y Chromium) si psutil está disponible,
+            medida como PSS/USS para no sumar varias veces la memoria
+            compartida entre procesos de Chromium; en caso contrario la RSS
+            del proceso de Python (Linux), o 0.0 si no se puede medir (el
+            watchdog queda desactivado)
+        """
+        if psutil is not None:
+            proceso = psutil.Process()
+            total = self._memoria_proceso(proceso)
+            for hijo in proceso.children(recursive=True):
+                try:
+                    total += self._memoria_proceso(hijo)
+                except psutil.Error:
+                    pass
+            return total / (1024 * 1024)
+        
+        try:
+            with open('/proc/self/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            pass
+        
+        # ru_maxrss no sirve: es un pico que nunca baja y sus unidades varían por SO
+        if self.memoria_maxima_mb and not self._aviso_sin_medicion:
+            logger.warning(
+                "No se puede medir la memoria (instala psutil): watchdog y reciclaje por RSS desactivados"
+            )
+            self._aviso_sin_medicion = True
+        return 0.0
+    
+    def _registrar_memoria(self) -> float:
+        """Mide la RSS actual y actualiza el pico del lote"""
+        rss = self._memoria_rss_mb()
+        if rss > self.estadisticas_memoria['pico_rss_mb']:
+            self.estadisticas_memoria['pico_rss_mb'] = rss
+        return rss
+    
+    def _debe_reciclar(self, rss: float) -> bool:
+        """
+        Indica si el contexto debe reciclarse antes de la siguiente búsqueda
+        
+        Args:
+            rss: Memoria residente actual en MB
+            
+        Returns:
+            True si se alcanzó el número de búsquedas o el umbral de RSS
+        """
+        if self.reciclar_cada and self._busquedas_en_contexto >= self.reciclar_cada:
+            return True
+        if self.memoria_maxima_mb and rss >= self.memoria_maxima_mb * self.UMBRAL_RECICLAJE:
+            # Histéresis: solo si hubo búsquedas y la RSS creció desde el último
+            # reciclaje; si no, otros procesos mantienen la memoria alta y
+            # reciclar antes de cada búsqueda no ayuda
+            crecimiento = rss - self._rss_tras_reciclaje
+            return (self._busquedas_en_contexto > 0
+                    and crecimiento >= self.memoria_maxima_mb * self.MARGEN_RECICLAJE)
+        return False
+    
+    def _vigilar_memoria(self) -> bool:
+        """
+        Watchdog de memoria: pausa el trabajo si la RSS supera el límite
+        
+        Si se supera memoria_maxima_mb se reinicia el navegador, se libera
+        memoria y se espera pausa_memoria segundos antes de volver a medir.
+        
+        Returns:
+            True si se puede continuar, False si hay que descartar el trabajo restante
+        """
+        if not self.memoria_maxima_mb:
+            return True
+        
+        rss = self._registrar_memoria()
+        if rss < self.memoria_maxima_mb:
+            return True
+        
+        logger.warning(
+            f"Memoria {rss:.0f} MB por encima del límite de {self.memoria_maxima_mb:.0f} MB, "
+            f"pausando {self.pausa_memoria} segundos"
+        )
+        self.estadisticas_memoria['pausas'] += 1
+        self._reiniciar_navegador()
+        gc.collect()
+        time.sleep(self.pausa_memoria)
+        
+        rss = self._registrar_memoria()
+        if rss < self.memoria_maxima_mb:
+            logger.info(f"Memoria recuperada: {rss:.0f} MB")
+            return True
+        
+        logger.error(f"La memoria sigue en {rss:.0f} MB tras la pausa")
+        return False
+    
+    def _buscar_en_pagina(self, page: Page, nombre_busqueda: str) -> List[Dict[str, str]]:
+        """
+        Realiza una búsqueda en una página ya abierta y extrae los resultados
+        
+        Args:
+            page: Página de Playwright
+            nombre_busqueda: Nombre o apellido a buscar
+            
+        Returns:
+            Lista de diccionarios con los datos encontrados
+        """
+        # Navegar a la página
+        logger.info(f"Navegando a {self.BASE_URL}")
+        inicio = time.perf_counter()
+        page.goto(self.BASE_URL, wait_until='networkidle', timeout=60000)
+        
+        # Esperar a que cargue el formulario
+        page.wait_for_selector('input[name="nombreCompleto"]', timeout=30000)
+        tiempo_formulario = time.perf_counter() - inicio
+        self.tiempos_formulario.append(tiempo_formulario)
+        logger.info(f"Formulario listo en {tiempo_formulario:.2f} s")
+        
+        # Ingresar nombre en el campo de búsqueda
+        logger.info("Ingresando nombre en el formulario")
+        page.fill('input[name="nombreCompleto"]', nombre_busqueda)
+        
+        # Hacer clic en el botón de buscar
+        logger.info("Haciendo clic en buscar")
+        search_button = page.query_selector('button.btn.btn-danger, button[type="submit"]')
+        if search_button:
+            search_button.click()
+        else:
+            logger.error("No se encontró el botón de búsqueda")
+            self._ultima_fallida = True
+            return []
+        
+        # Esperar a que carguen los resultados
+        if not self._wait_for_results(page):
+            logger.warning("No se cargaron resultados")
+            self._ultima_fallida = True
+            return []
+        
+        # Guardar HTML renderizado para re-procesarlo sin navegador
+        if self.guardar_snapshots:
+            self._guardar_snapshot(page, nombre_busqueda)
+        
+        # Extraer resultados
+        resultados_busqueda = []
+        
+        # Buscar tarjetas de resultados
+        cards = page.query_selector_all(SELECTOR_TARJETAS)
+        logger.info(f"Se encontraron {len(cards)} tarjetas")
+        
+        if len(cards) == 0:
+            # Intentar con otros selectores
+            cards = page.query_selector_all(SELECTOR_TARJETAS_ALT)
+            logger.info(f"Intento alternativo: {len(cards)} elementos encontrados")
+        
+        # Resultados paginados o en el límite: la búsqueda no los muestra todos
+        self._ultima_tarjetas = len(cards)
+        self._ultima_paginada = page.query_selector(SELECTOR_PAGINACION) is not None
+        self._ultima_saturada = self._ultima_paginada or (
+            bool(self.limite_resultados) and len(cards) >= self.limite_resultados
+        )
+        
+        for card in cards:
+            data = self._extract_card_data(card)
+            if data and data['nombre_completo'] != "N/A":
+                # Descargar foto
+                if self.descargar_fotos:
+                    data['foto_local'] = self._download_photo(
+                        data['foto_url'], 
+                        data['nombre_completo']
+                    )
+                else:
+                    data['foto_local'] = "N/A"
+                resultados_busqueda.append(data)
+        
+        if resultados_busqueda:
+            logger.info(f"Se encontraron {len(resultados_busqueda)} resultados")
+        else:
+            logger.warning("No se encontraron resultados válidos")
+        return resultados_busqueda
+    
+    def medir_tiempo_formulario(self, repeticiones: int = 5) -> List[float]:
+        """
+        Mide el tiempo hasta que el formulario de búsqueda está listo
+        
+        Cada repetición lanza el navegador desde cero, como una búsqueda
+        individual, para comparar perfil vacío frente a caché persistente.
+        
+        Args:
+            repeticiones: Número de cargas a medir
+            
+        Returns:
+            Lista de tiempos en segundos
+        """
+        tiempos = []
+        for i in range(repeticiones):
+            try:
+                self._iniciar_navegador()
+                page = self._context.new_page()
+                inicio = time.perf_counter()
+                page.goto(self.BASE_URL, wait_until='networkidle', timeout=60000)
+                page.wait_for_selector('input[name="nombreCompleto"]', timeout=30000)
+                tiempos.append(time.perf_counter() - inicio)
+                logger.info(f"Carga {i + 1}/{repeticiones}: {tiempos[-1]:.2f} s")
+            except Exception as e:
+                logger.error(f"Error en carga {i + 1}/{repeticiones}: {e}")
+            finally:
+                self._cerrar_navegador()
+        return tiempos
+    
     def buscar_requisitoriado(self, nombre_busqueda: str, max_retries: int = 3) -> List[Dict[str, str]]:
         """
         Busca requisitoriados por nombre o apellido
         
+        Si hay un navegador abierto (p. ej. dentro de buscar_multiples) se
+        reutiliza con una página nueva; si no, se lanza uno solo para esta búsqueda.
+        
         Args:
             nombre_busqueda: Nombre o apellido a buscar
             max_retries: Número máximo de reintentos
@@ -222,90 +656,55 @@ class RequisitoriadosScraper:
             Lista de diccionarios con los datos encontrados
         """
         logger.info(f"Buscando: {nombre_busqueda}")
+        self._ultima_saturada = False
+        self._ultima_paginada = False
+        self._ultima_tarjetas = 0
+        self._ultima_fallida = False
         
         for intento in range(max_retries):
+            sesion_propia = self._context is None
             try:
-                with sync_playwright() as p:
-                    # Lanzar navegador
-                    browser = p.chromium.launch(headless=True)
-                    context = browser.new_context(
-                        viewport={'width': 1920, 'height': 1080}
-                    )
-                    page = context.new_page()
-                    
-                    # Navegar a la página
-                    logger.info(f"Navegando a {self.BASE_URL}")
-                    page.goto(self.BASE_URL, wait_until='networkidle', timeout=60000)
-                    
-                    # Esperar a que cargue el formulario
-                    page.wait_for_selector('input[name="nombreCompleto"]', timeout=30000)
-                    
-                    # Ingresar nombre en el campo de búsqueda
-                    logger.info("Ingresando nombre en el formulario")
-                    page.fill('input[name="nombreCompleto"]', nombre_busqueda)
-                    
-                    # Hacer clic en el botón de buscar
-                    logger.info("Haciendo clic en buscar")
-                    search_button = page.query_selector('button.btn.btn-danger, button[type="submit"]')
-                    if search_button:
-                        search_button.click()
-                    else:
-                        logger.error("No se encontró el botón de búsqueda")
-                        browser.close()
-                        return []
-                    
-                    # Esperar a que carguen los resultados
-                    if not self._wait_for_results(page):
-                        logger.warning("No se cargaron resultados")
-                        browser.close()
-                        return []
-                    
-                    # Extraer resultados
-                    resultados_busqueda = []
-                    
-                    # Buscar tarjetas de resultados
-                    cards = page.query_selector_all('div.card')
-                    logger.info(f"Se encontraron {len(cards)} tarjetas")
-                    
-                    if len(cards) == 0:
-                        # Intentar con otros selectores
-                        cards = page.query_selector_all('div.resultado, div.item, article')
-                        logger.info(f"Intento alternativo: {len(cards)} elementos encontrados")
-                    
-                    for card in cards:
-                        data = self._extract_card_data(card)
-                        if data and data['nombre_completo'] != "N/A":
-                            # Descargar foto
-                            data['foto_local'] = self._download_photo(
-                                data['foto_url'], 
-                                data['nombre_completo']
-                            )
-                            resultados_busqueda.append(data)
-                    
-                    browser.close()
-                    
-                    if resultados_busqueda:
-                        logger.info(f"Se encontraron {len(resultados_busqueda)} resultados")
-                        return resultados_busqueda
-                    else:
-                        logger.warning("No se encontraron resultados válidos")
-                        return []
+                if sesion_propia:
+                    self._iniciar_navegador()
+                
+                page = self._context.new_page()
+                try:
+                    return self._buscar_en_pagina(page, nombre_busqueda)
+                finally:
+                    self._busquedas_en_contexto += 1
+                    try:
+                        page.close()
+                    except Exception as e:
+                        logger.debug(f"Error cerrando página: {e}")
                         
             except Exception as e:
                 logger.error(f"Error en intento {intento + 1}/{max_retries}: {e}")
+                if not sesion_propia:
+                    # El navegador compartido puede haber quedado inutilizable
+                    self._reiniciar_navegador()
                 if intento < max_retries - 1:
                     logger.info(f"Reintentando en 5 segundos...")
                     time.sleep(5)
                 else:
                     logger.error("Se agotaron los reintentos")
+                    self._ultima_fallida = True
                     return []
+            finally:
+                if sesion_propia:
+                    self._cerrar_navegador()
         
+        self._ultima_fallida = True
         return []
     
     def buscar_multiples(self, nombres: List[str]) -> List[Dict[str, str]]:
         """
         Realiza búsquedas múltiples
         
+        Reutiliza un único navegador para todo el lote, recicla el contexto
+        cada reciclar_cada búsquedas (o al acercarse al límite de memoria) y
+        detiene el lote si la memoria no baja de memoria_maxima_mb. Los
+        nombres no procesados quedan en self.pendientes.
+        
         Args:
             nombres: Lista de nombres a buscar
             
@@ -313,12 +712,453 @@ class RequisitoriadosScraper:
             Lista con todos los resultados encontrados
         """
         todos_resultados = []
+        self.pendientes = []
+        self.estadisticas_memoria = {'pico_rss_mb': 0.0, 'reciclajes': 0, 'pausas': 0}
+        
+        try:
+            self._iniciar_navegador()
+        except Exception as e:
+            logger.error(f"Error lanzando navegador: {e}")
+            self._cerrar_navegador()
+        
+        try:
+            for i, nombre in enumerate(nombres):
+                if not self._vigilar_memoria():
+                    self.pendientes = list(nombres[i:])
+                    logger.error(
+                        f"Lote detenido por memoria, {len(self.pendientes)} búsquedas pendientes"
+                    )
+                    break
+                
+                if self._context is None:
+                    self._reiniciar_navegador()
+                elif self._debe_reciclar(self._registrar_memoria()):
+                    self._reciclar_contexto()
+                
+                resultados = self.buscar_requisitoriado(nombre)
+                todos_resultados.extend(resultados)
+                self._registrar_memoria()
+                time.sleep(2)  # Pausa entre búsquedas
+        finally:
+            self._cerrar_navegador()
+        
+        logger.info(
+            f"Pico de memoria del lote: {self.estadisticas_memoria['pico_rss_mb']:.0f} MB "
+            f"({self.estadisticas_memoria['reciclajes']} reciclajes, "
+            f"{self.estadisticas_memoria['pausas']} pausas)"
+        )
+        
+        self.resultados = todos_resultados
+        return todos_resultados
+    
+    def _extensiones_prefijo(self, prefijo: str) -> List[str]:
+        """
+        Devuelve los prefijos un carácter más largos que cubren a un prefijo saturado
+        
+        Args:
+            prefijo: Prefijo saturado
+            
+        Returns:
+            Prefijo seguido de cada letra y, si no termina ya en uno, de cada separador
+        """
+        extensiones = [prefijo + letra for letra in self.ALFABETO_ENUMERACION]
+        if prefijo and prefijo[-1] not in self.SEPARADORES_ENUMERACION:
+            extensiones.extend(prefijo + sep for sep in self.SEPARADORES_ENUMERACION)
+        return extensiones
+    
+    def _atender_vigilante(self, estado: Dict):
+        """
+        Detiene al trabajador mientras el watchdog de la enumeración está en pausa
+        
+        Cierra el navegador para liberar memoria y espera a que termine la
+        pausa; la siguiente búsqueda vuelve a lanzarlo.
+        
+        Args:
+            estado: Estado compartido de la enumeración
+        """
+        if not estado['pausa'].is_set():
+            return
+        
+        self._cerrar_navegador()
+        with estado['lock']:
+            estado['en_pausa'] += 1
+        try:
+            while estado['pausa'].is_set() and not estado['detener'].is_set():
+                time.sleep(1)
+        finally:
+            with estado['lock']:
+                estado['en_pausa'] -= 1
+    
+    def _vigilante_enumeracion(self, estado: Dict, fin: threading.Event, intervalo: int = 2):
+        """
+        Watchdog único de memoria para todos los trabajadores de la enumeración
+        
+        Todos los trabajadores comparten el mismo árbol de procesos, así que la
+        memoria se mide una sola vez aquí y se actúa sobre todos a través de
+        estado: 'reciclaje_solicitado' pide reciclar contextos, 'pausa' cierra
+        los navegadores y 'detener' descarta el trabajo restante.
+        
+        Args:
+            estado: Estado compartido de la enumeración
+            fin: Evento que indica que la enumeración terminó
+            intervalo: Segundos entre mediciones
+        """
+        consultas_ultimo_reciclaje = 0
+        
+        while not fin.wait(intervalo):
+            rss = self._registrar_memoria()
+            
+            if rss >= self.memoria_maxima_mb:
+                logger.warning(
+                    f"Memoria {rss:.0f} MB por encima del límite de {self.memoria_maxima_mb:.0f} MB, "
+                    f"pausando a todos los trabajadores {self.pausa_memoria} segundos"
+                )
+                self.estadisticas_memoria['pausas'] += 1
+                estado['pausa'].set()
+                
+                # Esperar a que los trabajadores cierren sus navegadores
+                limite_espera = time.monotonic() + 120
+                while (estado['en_pausa'] < estado['activos']
+                       and time.monotonic() < limite_espera and not fin.is_set()):
+                    time.sleep(1)
+                
+                gc.collect()
+                time.sleep(self.pausa_memoria)
+                
+                rss = self._registrar_memoria()
+                if rss >= self.memoria_maxima_mb:
+                    logger.error(f"La memoria sigue en {rss:.0f} MB tras la pausa, deteniendo la enumeración")
+                    estado['detener'].set()
+                else:
+                    logger.info(f"Memoria recuperada: {rss:.0f} MB")
+                estado['pausa'].clear()
+                self._rss_tras_reciclaje = rss
+                consultas_ultimo_reciclaje = estado['consultas']
+            
+            elif (rss >= self.memoria_maxima_mb * self.UMBRAL_RECICLAJE
+                  and estado['consultas'] > consultas_ultimo_reciclaje
+                  and rss - self._rss_tras_reciclaje >= self.memoria_maxima_mb * self.MARGEN_RECICLAJE):
+                logger.info(f"Memoria en {rss:.0f} MB, solicitando reciclaje de contextos")
+                with estado['lock']:
+                    estado['reciclaje_solicitado'] += 1
+                self._rss_tras_reciclaje = rss
+                consultas_ultimo_reciclaje = estado['consultas']
+    
+    def _trabajador_enumeracion(self, cola: "queue.Queue", estado: Dict):
+        """
+        Procesa prefijos de la cola con un navegador propio
         
-        for nombre in nombres:
-            resultados = self.buscar_requisitoriado(nombre)
-            todos_resultados.extend(resultados)
-            time.sleep(2)  # Pausa entre búsquedas
+        Cada prefijo saturado se divide en prefijos un carácter más largos que
+        vuelven a la cola; de su propia búsqueda solo se conservan los registros
+        devueltos. Los registros se deduplican en estado['registros'].
         
+        Args:
+            cola: Cola compartida de prefijos (None indica fin)
+            estado: Estado compartido de la enumeración (protegido por estado['lock'])
+        """
+        lock = estado['lock']
+        detener = estado['detener']
+        reciclaje_visto = 0
+        self.estadisticas_memoria = {'pico_rss_mb': 0.0, 'reciclajes': 0, 'pausas': 0}
+        
+        try:
+            self._iniciar_navegador()
+        except Exception as e:
+            logger.error(f"Error lanzando navegador: {e}")
+            self._cerrar_navegador()
+        
+        try:
+            while True:
+                prefijo = cola.get()
+                if prefijo is None:
+                    cola.task_done()
+                    break
+                
+                try:
+                    # La memoria la vigila enumerar_registro para todos los trabajadores
+                    self._atender_vigilante(estado)
+                    if detener.is_set():
+                        with lock:
+                            estado['pendientes'].append(prefijo)
+                        continue
+                    
+                    if self._context is None:
+                        self._reiniciar_navegador()
+                        reciclaje_visto = estado['reciclaje_solicitado']
+                    elif reciclaje_visto < estado['reciclaje_solicitado'] or self._debe_reciclar(0.0):
+                        reciclaje_visto = estado['reciclaje_solicitado']
+                        self._reciclar_contexto()
+                    
+                    resultados = self.buscar_requisitoriado(prefijo)
+                    
+                    with lock:
+                        estado['consultas'] += 1
+                        if self._ultima_fallida:
+                            estado['pendientes'].append(prefijo)
+                            continue
+                        
+                        saturado = self._ultima_saturada
+                        if self._ultima_paginada:
+                            estado['paginacion_vista'] = True
+                        if self.limite_resultados is None and self._ultima_tarjetas > 0:
+                            # Sin límite conocido, el mayor número de tarjetas visto se
+                            # toma como tamaño de página: igualarlo cuenta como saturado
+                            if self._ultima_tarjetas >= estado['max_tarjetas']:
+                                saturado = True
+                            estado['max_tarjetas'] = max(estado['max_tarjetas'], self._ultima_tarjetas)
+                        
+                        nuevos = 0
+                        for data in resultados:
+                            clave = clave_registro(data)
+                            if clave not in estado['registros']:
+                                estado['registros'][clave] = data
+                                nuevos += 1
+                        
+                        # Búsquedas que ignoran acentos (PÁ/PA) devuelven la misma página
+                        # saturada que otro prefijo ya dividido: su subárbol está cubierto.
+                        # Un ancestro con la misma página no cuenta: el hijo es más
+                        # restrictivo y su página puede coincidir sin cubrir lo mismo
+                        huella = frozenset(clave_registro(data) for data in resultados)
+                        if saturado and huella:
+                            expandidos = estado['huellas_expandidas'].setdefault(huella, [])
+                            if any(not prefijo.startswith(otro) for otro in expandidos):
+                                estado['expansiones_omitidas'] += 1
+                                logger.info(f"Prefijo '{prefijo}': misma página que un prefijo ya dividido")
+                                saturado = False
+                            else:
+                                expandidos.append(prefijo)
+                        
+                        if saturado:
+                            if len(prefijo) >= estado['longitud_maxima']:
+                                estado['truncados'].append(prefijo)
+                                estado['pendientes'].append(prefijo)
+                            else:
+                                estado['divididos'] += 1
+                                for extension in self._extensiones_prefijo(prefijo):
+                                    cola.put(extension)
+                                # Ninguna extensión cubre un nombre igual al prefijo:
+                                # solo se tiene si apareció en la primera página
+                                if not any(
+                                    data['nombre_completo'].strip().upper() == prefijo.strip()
+                                    for data in resultados
+                                ):
+                                    estado['sin_nombre_exacto'].append(prefijo)
+                    
+                    logger.info(
+                        f"Prefijo '{prefijo}': {len(resultados)} resultados, {nuevos} nuevos"
+                        f"{' (saturado)' if saturado else ''}"
+                    )
+                    time.sleep(2)  # Pausa entre búsquedas
+                except Exception as e:
+                    # Un error inesperado no debe terminar el hilo: cola.join()
+                    # quedaría bloqueado si mueren todos los trabajadores
+                    logger.error(f"Error procesando prefijo '{prefijo}': {e}")
+                    with lock:
+                        estado['pendientes'].append(prefijo)
+                finally:
+                    cola.task_done()
+        finally:
+            self._cerrar_navegador()
+            with lock:
+                estado['memoria']['reciclajes'] += self.estadisticas_memoria['reciclajes']
+                estado['activos'] -= 1
+    
+    def enumerar_registro(self, trabajadores: int = 4, longitud_inicial: int = 1,
+                          longitud_maxima: int = 30,
+                          limite_resultados: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Enumera el registro completo mediante búsquedas por prefijos
+        
+        Empieza con todos los prefijos de longitud_inicial letras y solo divide
+        un prefijo en otros más largos cuando su resultado está paginado o
+        alcanza limite_resultados (sin límite, el mayor número de tarjetas
+        visto hasta el momento). Los prefijos se procesan en paralelo, cada
+        trabajador con su propio navegador, y los registros se deduplican
+        globalmente. Los prefijos que fallan o siguen saturados en
+        longitud_maxima quedan en self.pendientes, y las clases de registros
+        que la enumeración no puede garantizar quedan en self.no_cubiertos.
+        
+        Args:
+            trabajadores: Número de navegadores en paralelo
+            longitud_inicial: Longitud de los prefijos iniciales
+            longitud_maxima: Longitud a partir de la cual no se divide más
+            limite_resultados: Número de tarjetas que indica un resultado saturado
+            
+        Returns:
+            Lista de registros únicos encontrados
+            
+        Raises:
+            ValueError: Si trabajadores es menor que 1
+        """
+        if trabajadores < 1:
+            raise ValueError(f"trabajadores debe ser al menos 1 (recibido: {trabajadores})")
+        
+        prefijos = ['']
+        for _ in range(longitud_inicial):
+            prefijos = [p + letra for p in prefijos for letra in self.ALFABETO_ENUMERACION]
+        
+        logger.info(
+            f"Enumerando registro: {len(prefijos)} prefijos iniciales, {trabajadores} trabajadores"
+        )
+        
+        cola = queue.Queue()
+        for prefijo in prefijos:
+            cola.put(prefijo)
+        
+        self.estadisticas_memoria = {'pico_rss_mb': 0.0, 'reciclajes': 0, 'pausas': 0}
+        self._rss_tras_reciclaje = 0.0
+        
+        estado = {
+            'lock': threading.Lock(),
+            'detener': threading.Event(),
+            'registros': {},
+            'pendientes': [],
+            'truncados': [],
+            'sin_nombre_exacto': [],
+            'max_tarjetas': 0,
+            'huellas_expandidas': {},
+            'expansiones_omitidas': 0,
+            'paginacion_vista': False,
+            'consultas': 0,
+            'divididos': 0,
+            'longitud_maxima': longitud_maxima,
+            'memoria': self.estadisticas_memoria,
+            'pausa': threading.Event(),
+            'en_pausa': 0,
+            'activos': trabajadores,
+            'reciclaje_solicitado': 0,
+        }
+        
+        hilos = []
+        for _ in range(trabajadores):
+            # Playwright síncrono no es thread-safe: una instancia por hilo
+            trabajador = RequisitoriadosScraper(
+                guardar_snapshots=self.guardar_snapshots,
+                comprimir_snapshots=self.comprimir_snapshots,
+                reciclar_cada=self.reciclar_cada,
+                memoria_maxima_mb=None,  # Un único watchdog en este hilo para todos
+                pausa_memoria=self.pausa_memoria,
+                descargar_fotos=False,
+                cache_persistente=self.cache_persistente,
+                tamano_cache_mb=self.tamano_cache_mb,
+                headless=self.headless,
+            )
+            # Chromium bloquea el perfil: cada trabajador usa uno hermano, no anidado
+            trabajador.perfil_dir = self.perfil_dir.parent / f"{self.perfil_dir.name}_{len(hilos) + 1}"
+            trabajador.limite_resultados = limite_resultados
+            hilo = threading.Thread(
+                target=trabajador._trabajador_enumeracion,
+                args=(cola, estado),
+                daemon=True,
+            )
+            hilo.start()
+            hilos.append(hilo)
+        
+        fin = threading.Event()
+        vigilante = None
+        if self.memoria_maxima_mb:
+            vigilante = threading.Thread(
+                target=self._vigilante_enumeracion,
+                args=(estado, fin),
+                daemon=True,
+            )
+            vigilante.start()
+        
+        cola.join()
+        fin.set()
+        for _ in hilos:
+            cola.put(None)
+        for hilo in hilos:
+            hilo.join()
+        if vigilante is not None:
+            vigilante.join()
+        
+        todos_resultados = list(estado['registros'].values())
+        
+        # Descargar fotos una sola vez por registro único
+        if self.descargar_fotos:
+            for data in todos_resultados:
+                data['foto_local'] = self._download_photo(data['foto_url'], data['nombre_completo'])
+        
+        # Caracteres de nombres encontrados que ningún prefijo puede extender:
+        # sus vecinos no vistos tras un prefijo saturado no son alcanzables
+        alfabeto = set(self.ALFABETO_ENUMERACION + self.SEPARADORES_ENUMERACION)
+        fuera_alfabeto = sorted({
+            c for data in todos_resultados
+            for c in data['nombre_completo'].strip().upper() if c not in alfabeto
+        })
+        
+        self.no_cubiertos = {
+            'prefijos_saturados_en_longitud_maxima': estado['truncados'],
+            'nombre_igual_a_prefijo_saturado': estado['sin_nombre_exacto'],
+            'caracteres_fuera_del_alfabeto': fuera_alfabeto,
+        }
+        
+        if limite_resultados is None and not estado['paginacion_vista']:
+            logger.warning(
+                f"No se detectó paginación ni se fijó limite_resultados: la saturación se "
+                f"infirió del máximo de tarjetas por búsqueda ({estado['max_tarjetas']}). "
+                f"Verifica SELECTOR_PAGINACION o fija limite_resultados"
+            )
+        if estado['truncados']:
+            logger.warning(
+                f"{len(estado['truncados'])} prefijos siguen saturados en la longitud máxima: "
+                f"{', '.join(estado['truncados'][:10])}"
+            )
+        if estado['sin_nombre_exacto']:
+            logger.warning(
+                f"{len(estado['sin_nombre_exacto'])} prefijos saturados sin verificar un nombre "
+                f"idéntico al prefijo (no alcanzable si no salió en la primera página)"
+            )
+        if fuera_alfabeto:
+            logger.warning(
+                f"Nombres con caracteres fuera del alfabeto de enumeración: {''.join(fuera_alfabeto)!r}"
+            )
+        if estado['pendientes']:
+            logger.warning(
+                f"{len(estado['pendientes'])} prefijos pendientes por errores, memoria o longitud máxima"
+            )
+        
+        logger.info(
+            f"Enumeración completada: {len(todos_resultados)} registros únicos en "
+            f"{estado['consultas']} consultas ({estado['divididos']} prefijos divididos, "
+            f"{estado['expansiones_omitidas']} divisiones repetidas omitidas, "
+            f"pico de memoria {estado['memoria']['pico_rss_mb']:.0f} MB)"
+        )
+        
+        self.pendientes = estado['pendientes']
+        self.resultados = todos_resultados
+        return todos_resultados
+    
+    def parsear_snapshots(self, directorio: Optional[Path] = None) -> List[Dict[str, str]]:
+        """
+        Re-extrae los resultados desde snapshots HTML guardados, sin navegador
+        
+        Los registros repetidos entre snapshots se deduplican igual que en
+        enumerar_registro.
+        
+        Args:
+            directorio: Directorio de snapshots (por defecto SNAPSHOTS_DIR)
+            
+        Returns:
+            Lista con todos los resultados encontrados
+        """
+        directorio = Path(directorio) if directorio else self.SNAPSHOTS_DIR
+        logger.info(f"Procesando snapshots de {directorio}")
+        
+        # Los snapshots de búsquedas solapadas (p. ej. de enumerar_registro)
+        # repiten registros: se aplica la misma deduplicación global
+        todos_resultados = deduplicar_registros(static_parser.parsear_snapshots(directorio))
+        
+        # Asociar fotos ya descargadas sin volver a descargarlas
+        for data in todos_resultados:
+            data['foto_local'] = "N/A"
+            if data['foto_url'] != "N/A" and data['foto_url']:
+                filepath = self.FOTOS_DIR / self._nombre_archivo_foto(data['foto_url'], data['nombre_completo'])
+                if filepath.exists():
+                    data['foto_local'] = str(filepath.relative_to(self.OUTPUT_DIR.parent))
+        
+        logger.info(f"Se extrajeron {len(todos_resultados)} resultados de snapshots")
         self.resultados = todos_resultados
         return todos_resultados
     
@@ -384,7 +1224,9 @@ def main():
     print("\nModo de búsqueda:")
     print("1. Búsqueda simple")
     print("2. Búsquedas múltiples")
-    opcion = input("\nSelecciona una opción (1 o 2): ").strip()
+    print("3. Re-procesar snapshots guardados (sin navegador)")
+    print("4. Enumerar registro completo (por prefijos)")
+    opcion = input("\nSelecciona una opción (1-4): ").strip()
     
     if opcion == "1":
         # Búsqueda simple
@@ -417,6 +1259,31 @@ def main():
                 print(f"\n✓ Se encontraron {len(resultados)} resultados en total")
             else:
                 print("\n✗ No se encontraron resultados")
+    
+    elif opcion == "3":
+        # Re-procesar snapshots
+        if not scraper.SNAPSHOTS_DIR.is_dir():
+            print(f"\n✗ No existe el directorio de snapshots: {scraper.SNAPSHOTS_DIR}")
+            return
+        
+        resultados = scraper.parsear_snapshots()
+        
+        if resultados:
+            print(f"\n✓ Se extrajeron {len(resultados)} resultados de los snapshots")
+        else:
+            print("\n✗ No se encontraron resultados")
+    
+    elif opcion == "4":
+        # Enumeración completa
+        print("\nEnumerando el registro completo, esto puede tardar...")
+        resultados = scraper.enumerar_registro()
+        
+        if resultados:
+            print(f"\n✓ Se encontraron {len(resultados)} registros únicos")
+            if scraper.pendientes:
+                print(f"⚠️  {len(scraper.pendientes)} prefijos pendientes: {', '.join(scraper.pendientes[:10])}")
+        else:
+            print("\n✗ No se encontraron resultados")
     else:
         print("Opción no válida")
         return
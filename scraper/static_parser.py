@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Parser estático para snapshots HTML de recompensas.pe/requisitoriados
+
+Extrae el mismo esquema de registros que el scraper en vivo, pero a partir
+del HTML guardado de las páginas de resultados, sin necesidad de navegador.
+
+Uso:
+    python static_parser.py [directorio_snapshots] [archivo_salida.json]
+"""
+
+import gzip
+import json
+import logging
+import re
+import sys
+from pathlib import Path
+from typing import List, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Selectores compartidos por el scraper en vivo y el parser estático
+SELECTOR_TARJETAS = 'div.card'
+SELECTOR_TARJETAS_ALT = 'div.resultado, div.item, article'
+SELECTOR_NOMBRE = 'h5.card-title, h4.card-title, div.card-title, p.fw-bold'
+SELECTOR_FOTO = 'img'
+SELECTOR_RECOMPENSA = 'p.text-danger, span.text-danger, div.text-danger, h3.text-danger, h4.text-danger'
+SELECTOR_CUERPO = 'div.card-body'
+SELECTOR_PAGINACION = 'ul.pagination, pagination-controls'
+
+# Elementos de bloque que generan saltos de línea en el texto visible
+_ELEMENTOS_BLOQUE = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'section',
+    'table', 'tr', 'ul',
+}
+_ELEMENTOS_OCULTOS = {'script', 'style', 'template', 'noscript'}
+
+
+def extraer_campos(nombre: Optional[str], foto_url: Optional[str],
+                   recompensa: Optional[str], texto_tarjeta: str,
+                   texto_cuerpo: Optional[str]) -> Dict[str, str]:
+    """
+    Construye el registro de un requisitoriado a partir de los textos de su tarjeta
+
+    Args:
+        nombre: Texto del elemento de nombre (None si no existe)
+        foto_url: Atributo src de la imagen (None si no existe)
+        recompensa: Texto del elemento de recompensa (None si no existe)
+        texto_tarjeta: Texto visible de toda la tarjeta
+        texto_cuerpo: Texto visible del card-body (None si no existe)
+
+    Returns:
+        Diccionario con los datos extraídos
+    """
+    data = {}
+
+    data['nombre_completo'] = nombre.strip() if nombre is not None else "N/A"
+    data['foto_url'] = foto_url if foto_url is not None else "N/A"
+
+    if recompensa is None:
+        # Buscar en todo el texto que contenga "S/"
+        for line in texto_tarjeta.split('\n'):
+            if 'S/' in line or 's/' in line.lower():
+                data['recompensa'] = line.strip()
+                break
+        else:
+            data['recompensa'] = "N/A"
+    else:
+        data['recompensa'] = recompensa.strip()
+
+    data['estado'] = "N/A"
+    data['sexo'] = "N/A"
+    data['lugar_ro'] = "N/A"
+    data['delitos'] = "N/A"
+
+    # Estos datos suelen estar en el cuerpo de la tarjeta
+    if texto_cuerpo is None:
+        return data
+
+    lines = texto_cuerpo.split('\n')
+
+    for i, line in enumerate(lines):
+        line_lower = line.lower().strip()
+
+        if 'estado' in line_lower and i + 1 < len(lines):
+            # El valor puede estar en la misma línea o en la siguiente
+            if ':' in line:
+                data['estado'] = line.split(':', 1)[1].strip()
+            elif i + 1 < len(lines):
+                data['estado'] = lines[i + 1].strip()
+
+        elif 'sexo' in line_lower:
+            if ':' in line:
+                data['sexo'] = line.split(':', 1)[1].strip()
+            elif i + 1 < len(lines):
+                data['sexo'] = lines[i + 1].strip()
+
+        elif 'lugar' in line_lower and 'ro' in line_lower:
+            if ':' in line:
+                data['lugar_ro'] = line.split(':', 1)[1].strip()
+            elif i + 1 < len(lines):
+                data['lugar_ro'] = lines[i + 1].strip()
+
+        elif 'delito' in line_lower:
+            if ':' in line:
+                data['delitos'] = line.split(':', 1)[1].strip()
+            elif i + 1 < len(lines):
+                # El delito puede ocupar múltiples líneas
+                delito_lines = []
+                for j in range(i + 1, len(lines)):
+                    next_line = lines[j].strip()
+                    if next_line and not any(k in next_line.lower() for k in ['estado', 'sexo', 'lugar', 'recompensa']):
+                        delito_lines.append(next_line)
+                    else:
+                        break
+                if delito_lines:
+                    data['delitos'] = ' '.join(delito_lines)
+
+    return data
+
+
+def clave_registro(data: Dict[str, str]) -> tuple:
+    """
+    Clave de deduplicación de un registro
+
+    El nombre y la URL de la foto identifican a la persona; sin foto se
+    añaden delitos, lugar de RO, recompensa y sexo para no fusionar a
+    personas distintas con el mismo nombre.
+
+    Args:
+        data: Registro extraído
+
+    Returns:
+        Tupla usable como clave de diccionario
+    """
+    nombre = data['nombre_completo'].strip().upper()
+    if data.get('foto_url') and data['foto_url'] != "N/A":
+        return (nombre, data['foto_url'])
+    return (
+        nombre,
+        data.get('delitos', "N/A"),
+        data.get('lugar_ro', "N/A"),
+        data.get('recompensa', "N/A"),
+        data.get('sexo', "N/A"),
+    )
+
+
+def deduplicar_registros(registros: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Elimina registros repetidos conservando el orden de primera aparición"""
+    unicos = {}
+    for data in registros:
+        unicos.setdefault(clave_registro(data), data)
+    return list(unicos.values())
+
+
+def _selector_a_xpath(selector: str) -> str:
+    """
+    Convierte una lista de selectores CSS simples (tag o tag.clase) a XPath
+
+    Args:
+        selector: Selectores separados por comas, p. ej. 'h5.card-title, img'
+
+    Returns:
+        Expresión XPath relativa equivalente
+    """
+    partes = []
+    for simple in selector.split(','):
+        tag, *clases = simple.strip().split('.')
+        condiciones = ''.join(
+            f"[contains(concat(' ', normalize-space(@class), ' '), ' {clase} ')]"
+            for clase in clases
+        )
+        partes.append(f".//{tag or '*'}{condiciones}")
+    return ' | '.join(partes)
+
+
+def _query_selector(elem, selector: str):
+    """Devuelve el primer elemento (en orden de documento) que coincide con el selector"""
+    encontrados = elem.xpath(_selector_a_xpath(selector))
+    return encontrados[0] if encontrados else None
+
+
+def _texto_visible(elem) -> str:
+    """
+    Aproxima el innerText del navegador para un elemento de lxml
+
+    Los elementos de bloque y <br> generan saltos de línea, los <p> dejan una
+    línea en blanco y se omiten scripts y estilos.
+    """
+    partes = []
+
+    def recorrer(e):
+        tag = e.tag if isinstance(e.tag, str) else ''
+        if tag in _ELEMENTOS_OCULTOS:
+            return
+        if tag == 'br':
+            partes.append('\n')
+        elif tag == 'p':
+            partes.append('\n\n')
+        elif tag in _ELEMENTOS_BLOQUE:
+            partes.append('\n')
+        if tag and e.text:
+            partes.append(e.text)
+        for hijo in e:
+            recorrer(hijo)
+            if hijo.tail:
+                partes.append(hijo.tail)
+        if tag == 'p':
+            partes.append('\n\n')
+        elif tag in _ELEMENTOS_BLOQUE:
+            partes.append('\n')
+
+    recorrer(elem)
+
+    texto = re.sub(r'[ \t\r\f\v]+', ' ', ''.join(partes))
+    texto = '\n'.join(line.strip() for line in texto.split('\n'))
+    texto = re.sub(r'\n{3,}', '\n\n', texto)
+    return texto.strip('\n')
+
+
+def _extraer_tarjeta(card) -> Optional[Dict[str, str]]:
+    """
+    Extrae datos de una tarjeta de requisitoriado de un árbol lxml
+
+    Args:
+        card: Elemento lxml de la tarjeta
+
+    Returns:
+        Diccionario con los datos extraídos o None si hay error
+    """
+    try:
+        nombre_elem = _query_selector(card, SELECTOR_NOMBRE)
+        img_elem = _query_selector(card, SELECTOR_FOTO)
+        recompensa_elem = _query_selector(card, SELECTOR_RECOMPENSA)
+        cuerpo_elem = _query_selector(card, SELECTOR_CUERPO)
+
+        return extraer_campos(
+            nombre=_texto_visible(nombre_elem) if nombre_elem is not None else None,
+            foto_url=img_elem.get('src') if img_elem is not None else None,
+            recompensa=_texto_visible(recompensa_elem) if recompensa_elem is not None else None,
+            texto_tarjeta=_texto_visible(card),
+            texto_cuerpo=_texto_visible(cuerpo_elem) if cuerpo_elem is not None else None,
+        )
+    except Exception as e:
+        logger.error(f"Error extrayendo datos de tarjeta: {e}")
+        return None
+
+
+def parsear_html(html: str) -> List[Dict[str, str]]:
+    """
+    Extrae los requisitoriados de una página de resultados renderizada
+
+    Args:
+        html: HTML de la página de resultados
+
+    Returns:
+        Lista de diccionarios con los datos encontrados
+    """
+    try:
+        from lxml import html as lxml_html
+    except ImportError:
+        raise ImportError(
+            "El parser estático requiere lxml. Instálalo con: pip install lxml"
+        )
+
+    if not html.strip():
+        return []
+
+    documento = lxml_html.fromstring(html)
+
+    cards = documento.xpath(_selector_a_xpath(SELECTOR_TARJETAS))
+    if len(cards) == 0:
+        cards = documento.xpath(_selector_a_xpath(SELECTOR_TARJETAS_ALT))
+
+    resultados = []
+    for card in cards:
+        data = _extraer_tarjeta(card)
+        if data and data['nombre_completo'] != "N/A":
+            resultados.append(data)
+
+    return resultados
+
+
+def leer_snapshot(ruta: Path) -> str:
+    """
+    Lee un snapshot HTML, comprimido (.html.gz) o no (.html)
+
+    Args:
+        ruta: Ruta del snapshot
+
+    Returns:
+        Contenido HTML del snapshot
+    """
+    ruta = Path(ruta)
+    if ruta.suffix == '.gz':
+        with gzip.open(ruta, 'rt', encoding='utf-8') as f:
+            return f.read()
+    return ruta.read_text(encoding='utf-8')
+
+
+def listar_snapshots(directorio: Path) -> List[Path]:
+    """Devuelve los snapshots de un directorio ordenados por nombre"""
+    directorio = Path(directorio)
+    return sorted(
+        p for p in directorio.iterdir()
+        if p.name.endswith('.html') or p.name.endswith('.html.gz')
+    )
+
+
+def parsear_snapshots(directorio: Path) -> List[Dict[str, str]]:
+    """
+    Extrae los requisitoriados de todos los snapshots de un directorio
+
+    Args:
+        directorio: Directorio con archivos .html o .html.gz
+
+    Returns:
+        Lista con todos los resultados encontrados
+    """
+    todos_resultados = []
+
+    for ruta in listar_snapshots(directorio):
+        try:
+            resultados = parsear_html(leer_snapshot(ruta))
+        except ImportError:
+            raise
+        except Exception as e:
+            logger.error(f"Error procesando snapshot {ruta.name}: {e}")
+            continue
+
+        logger.info(f"{ruta.name}: {len(resultados)} resultados")
+        todos_resultados.extend(resultados)
+
+    return todos_resultados
+
+
+def main():
+    """Re-deriva el dataset completo desde los snapshots guardados"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    directorio = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).parent / "output" / "snapshots"
+    salida = Path(sys.argv[2]) if len(sys.argv) > 2 else Path(__file__).parent / "output" / "resultados_snapshots.json"
+
+    if not directorio.is_dir():
+        print(f"✗ No existe el directorio de snapshots: {directorio}")
+        return 1
+
+    # Los snapshots de búsquedas solapadas (p. ej. de una enumeración) repiten registros
+    resultados = deduplicar_registros(parsear_snapshots(directorio))
+
+    with open(salida, 'w', encoding='utf-8') as f:
+        json.dump(resultados, f, ensure_ascii=False, indent=2)
+
+    print(f"✓ {len(resultados)} resultados extraídos de {directorio}")
+    print(f"  - JSON: {salida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())